@@ -1,9 +1,10 @@
 """Application settings using Pydantic Settings."""  # noqa: I002
 
 import os
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.shared.exceptions import ConfigurationException
@@ -17,7 +18,13 @@ def _get_env_files() -> list[str]:
     return [".env.local", ".env.test", ".env"]  # Local dev, test, then default
 
 
-class Environment(str, Enum):
+_ENV_FILES = _get_env_files()
+
+_SAMPLE_API_KEY_MARKER = "sample"
+_POSTGRESQL_URL_PREFIXES = ("postgresql://", "postgresql+")
+
+
+class Environment(StrEnum):
     """Valid application environments."""
 
     DEVELOPMENT = "development"
@@ -29,6 +36,8 @@ class Environment(str, Enum):
 class APISettings(BaseModel):
     """API server configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     host: str = Field(default="0.0.0.0", description="API server host")  # noqa: S104
     port: int = Field(default=8000, ge=1000, le=65535, description="API server port")
     title: str = Field(default="FastAPI Template", description="API title")
@@ -42,7 +51,7 @@ class APISettings(BaseModel):
     openapi_url: str | None = Field(default="/openapi.json", description="OpenAPI JSON URL")
 
 
-class DatabaseType(str, Enum):
+class DatabaseType(StrEnum):
     """Supported database types."""
 
     FIRESTORE = "firestore"
@@ -51,9 +60,15 @@ class DatabaseType(str, Enum):
     IN_MEMORY = "in_memory"
 
 
+_TRANSACTIONAL_DATABASES = frozenset({DatabaseType.POSTGRESQL, DatabaseType.FIRESTORE})
+_FULL_TEXT_SEARCH_DATABASES = frozenset({DatabaseType.POSTGRESQL, DatabaseType.FIRESTORE})
+
+
 class DatabaseSettings(BaseModel):
     """Multi-database configuration with feature flags."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     # Primary database configuration
     primary_db: DatabaseType = Field(
         default=DatabaseType.IN_MEMORY,
@@ -121,7 +136,7 @@ class DatabaseSettings(BaseModel):
         Returns:
             True if transactions are supported
         """
-        return self.primary_db in {DatabaseType.POSTGRESQL, DatabaseType.FIRESTORE}
+        return self.primary_db in _TRANSACTIONAL_DATABASES
 
     def supports_acid(self) -> bool:
         """Check if primary database supports ACID properties.
@@ -145,12 +160,14 @@ class DatabaseSettings(BaseModel):
         Returns:
             True if full-text search is supported
         """
-        return self.primary_db in {DatabaseType.POSTGRESQL, DatabaseType.FIRESTORE}
+        return self.primary_db in _FULL_TEXT_SEARCH_DATABASES
 
 
 class SecuritySettings(BaseModel):
     """Security and authentication configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     api_keys: list[str] = Field(
         default_factory=lambda: ["sample-api-key-replace-in-production"],
         description="Valid API keys for authentication",
@@ -186,6 +203,8 @@ class SecuritySettings(BaseModel):
 class ObservabilitySettings(BaseModel):
     """Observability configuration (logging, metrics, health checks)."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     # Logging settings
     log_level: str = Field(
         default="INFO",
@@ -223,6 +242,8 @@ class ObservabilitySettings(BaseModel):
 class FeatureFlagSettings(BaseModel):
     """Feature flag configuration."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     # Sample feature flags - replace with your actual features
     new_user_onboarding_enabled: bool = Field(
         default=True,
@@ -249,6 +270,8 @@ class FeatureFlagSettings(BaseModel):
 class ExternalServicesSettings(BaseModel):
     """External service integrations."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     # Email service settings
     email_service_enabled: bool = Field(default=False, description="Enable email service")
     email_service_api_key: str = Field(default="", description="Email service API key")
@@ -270,7 +293,7 @@ class ApplicationSettings(BaseSettings):
     """Main application settings."""
 
     model_config = SettingsConfigDict(
-        env_file=_get_env_files(),
+        env_file=_ENV_FILES,
         env_file_encoding="utf-8",
         case_sensitive=False,
         env_prefix="",
@@ -308,19 +331,17 @@ class ApplicationSettings(BaseSettings):
 
     def validate_configuration(self) -> None:
         """Validate configuration for common issues."""
-        self._validate_production_settings()
+        if self.is_production():
+            self._validate_production_settings()
         self._validate_database_configuration()
         self._validate_external_services()
 
     def _validate_production_settings(self) -> None:
         """Validate production-specific settings."""
-        if not self.is_production():
-            return
-
         if self.debug:
             raise ConfigurationException("Debug mode cannot be enabled in production")  # noqa: EM101, TRY003
 
-        if "sample" in str(self.security.api_keys[0]).lower():
+        if _SAMPLE_API_KEY_MARKER in self.security.api_keys[0].casefold():
             raise ConfigurationException("Sample API keys cannot be used in production")  # noqa: EM101, TRY003
 
         if self.database.primary_db == DatabaseType.IN_MEMORY:
@@ -329,7 +350,7 @@ class ApplicationSettings(BaseSettings):
     def _validate_database_configuration(self) -> None:
         """Validate database configuration."""
         if self.database.enable_postgresql and not self.database.database_url.startswith(
-            "postgresql"
+            _POSTGRESQL_URL_PREFIXES
         ):
             raise ConfigurationException("PostgreSQL enabled but database URL is not PostgreSQL")  # noqa: EM101, TRY003
 
@@ -354,10 +375,7 @@ class ApplicationSettings(BaseSettings):
             raise ConfigurationException("SMS service API key required when SMS is enabled")  # noqa: EM101, TRY003
 
 
-# Global settings instance (lowercase because it's mutable)
-_settings: ApplicationSettings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> ApplicationSettings:
     """
     Get application settings singleton.
@@ -368,16 +386,11 @@ def get_settings() -> ApplicationSettings:
     Raises:
         ConfigurationException: If configuration validation fails
     """
-    global _settings  # pylint: disable=global-statement  # noqa: PLW0603
-
-    if _settings is None:
-        _settings = ApplicationSettings()
-        _settings.validate_configuration()
-
-    return _settings
+    settings = ApplicationSettings()
+    settings.validate_configuration()
+    return settings
 
 
 def reset_settings() -> None:
     """Reset settings singleton (useful for testing)."""
-    global _settings  # pylint: disable=global-statement  # noqa: PLW0603
-    _settings = None
+    get_settings.cache_clear()
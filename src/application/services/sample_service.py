@@ -12,6 +12,7 @@ Replace this with your actual business services.
 
 from __future__ import annotations
 
+import time
 from datetime import UTC, datetime
 from typing import Any, Protocol
 from uuid import uuid4
@@ -120,7 +121,7 @@ class SampleApplicationService:
         4. Handles errors gracefully
         5. Returns structured results
         """
-        operation_start = datetime.now(UTC)
+        operation_start = time.perf_counter()
         errors = []
 
         self.logger.info(
@@ -182,7 +183,7 @@ class SampleApplicationService:
             DomainEventRegistry.publish(domain_event)
 
             # Step 7: Record metrics
-            processing_duration = (datetime.now(UTC) - operation_start).total_seconds()
+            processing_duration = time.perf_counter() - operation_start
             self.metrics.increment_counter("user_onboarding_completed_total", {})
             self.metrics.record_histogram(
                 "user_onboarding_duration_seconds",
@@ -206,7 +207,7 @@ class SampleApplicationService:
             )
 
         except BusinessLogicError as e:
-            processing_duration = (datetime.now(UTC) - operation_start).total_seconds()
+            processing_duration = time.perf_counter() - operation_start
             self.metrics.increment_counter("user_onboarding_failed_total", {"reason": e.error_code})
 
             self.logger.error(
@@ -225,7 +226,7 @@ class SampleApplicationService:
             )
 
         except Exception as e:
-            processing_duration = (datetime.now(UTC) - operation_start).total_seconds()
+            processing_duration = time.perf_counter() - operation_start
             self.metrics.increment_counter("user_onboarding_failed_total", {"reason": "unexpected"})
 
             self.logger.error(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
@@ -24,7 +24,7 @@ if TYPE_CHECKING:
     from src.domain.types import ChangeData
 
 
-class UserStatus(str, Enum):
+class UserStatus(StrEnum):
     """User status enumeration."""
 
     PENDING = "pending"
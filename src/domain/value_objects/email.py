@@ -7,6 +7,21 @@ from pydantic import BaseModel, field_validator
 
 from src.shared.exceptions import ValidationException
 
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+_PERSONAL_EMAIL_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "yahoo.com",
+        "hotmail.com",
+        "outlook.com",
+        "icloud.com",
+        "aol.com",
+        "live.com",
+        "msn.com",
+    }
+)
+
 
 class Email(BaseModel):
     """
@@ -34,8 +49,7 @@ class Email(BaseModel):
         email = v.strip().lower()
 
         # Basic email pattern validation
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, email):
+        if not _EMAIL_PATTERN.match(email):
             raise ValidationException("Invalid email format", field="email")
 
         # Check for common typos
@@ -80,17 +94,7 @@ class Email(BaseModel):
 
     def is_business_email(self) -> bool:
         """Check if email appears to be a business email."""
-        personal_domains = {
-            "gmail.com",
-            "yahoo.com",
-            "hotmail.com",
-            "outlook.com",
-            "icloud.com",
-            "aol.com",
-            "live.com",
-            "msn.com",
-        }
-        return self.domain not in personal_domains
+        return self.domain not in _PERSONAL_EMAIL_DOMAINS
 
     def mask_for_display(self) -> str:
         """Return masked email for privacy-safe display."""
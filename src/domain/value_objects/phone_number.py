@@ -1,12 +1,42 @@
 """Phone number value object with validation."""
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, field_validator
 
 from src.shared.exceptions import ValidationException
 
+_NON_PHONE_CHARS_PATTERN = re.compile(r"[^\d+]")
+
+# Some common US mobile area codes (this is not comprehensive)
+_MOBILE_AREA_CODES = frozenset({"201", "202", "203", "212", "213", "214", "215"})
+
+
+@lru_cache(maxsize=4096)
+def _normalize_phone_number(raw: str) -> str:
+    """Normalize and validate a raw phone number string.
+
+    Results are cached so repeated numbers skip revalidation; invalid input
+    raises and is never cached.
+    """
+    # Remove all non-digit characters except +
+    phone = _NON_PHONE_CHARS_PATTERN.sub("", raw.strip())
+
+    # Basic validation - must start with + and have 10-15 digits
+    if not phone.startswith("+"):
+        raise ValidationException("Phone number must start with country code (+)", field="phone")
+
+    digits_only = phone[1:]  # Remove the + sign
+    if not digits_only.isdigit():
+        raise ValidationException("Phone number can only contain digits and +", field="phone")
+
+    if len(digits_only) < 10 or len(digits_only) > 15:
+        raise ValidationException("Phone number must be between 10-15 digits", field="phone")
+
+    return phone
+
 
 class PhoneNumber(BaseModel):
     """
@@ -34,23 +64,7 @@ class PhoneNumber(BaseModel):
         if not v or not isinstance(v, str):
             raise ValidationException("Phone number cannot be empty", field="phone")
 
-        # Remove all non-digit characters except +
-        phone = re.sub(r"[^\d+]", "", v.strip())
-
-        # Basic validation - must start with + and have 10-15 digits
-        if not phone.startswith("+"):
-            raise ValidationException(
-                "Phone number must start with country code (+)", field="phone"
-            )
-
-        digits_only = phone[1:]  # Remove the + sign
-        if not digits_only.isdigit():
-            raise ValidationException("Phone number can only contain digits and +", field="phone")
-
-        if len(digits_only) < 10 or len(digits_only) > 15:
-            raise ValidationException("Phone number must be between 10-15 digits", field="phone")
-
-        return phone
+        return _normalize_phone_number(v)
 
     def __str__(self) -> str:
         """Return phone number string representation."""
@@ -124,10 +138,7 @@ class PhoneNumber(BaseModel):
 
         # US mobile numbers often start with certain prefixes
         if self.country_code == "1" and len(national) == 10:
-            area_code = national[:3]
-            # Some common mobile area codes (this is not comprehensive)
-            mobile_prefixes = {"201", "202", "203", "212", "213", "214", "215"}
-            return area_code in mobile_prefixes
+            return national[:3] in _MOBILE_AREA_CODES
 
         return True  # Default to mobile for other countries
 
@@ -1,6 +1,5 @@
 """FastAPI exception handlers for domain-specific exceptions."""
 
-import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, cast
 
@@ -45,7 +44,6 @@ async def validation_exception_handler(
     exc: Exception,
 ) -> JSONResponse:
     """Handle validation exceptions with field context."""
-    await asyncio.sleep(0.01)  # Simulate async work
     logger = get_logger(__name__)
     metrics = get_metrics_collector()
 
@@ -90,7 +88,6 @@ async def not_found_exception_handler(
     exc: Exception,
 ) -> JSONResponse:
     """Handle business logic not found exceptions."""
-    await asyncio.sleep(0.01)
     logger = get_logger(__name__)
     metrics = get_metrics_collector()
 
@@ -129,7 +126,6 @@ async def rate_limit_exception_handler(
     exc: Exception,
 ) -> JSONResponse:
     """Handle rate limit exceeded exceptions."""
-    await asyncio.sleep(0.01)
     logger = get_logger(__name__)
     metrics = get_metrics_collector()
 
@@ -171,7 +167,6 @@ async def infrastructure_exception_handler(
     exc: Exception,
 ) -> JSONResponse:
     """Handle infrastructure-level exceptions."""
-    await asyncio.sleep(0.01)
     logger = get_logger(__name__)
     metrics = get_metrics_collector()
     settings = get_settings()
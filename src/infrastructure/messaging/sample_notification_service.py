@@ -1,5 +1,6 @@
 """Sample notification service for template demonstration."""
 
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -44,7 +45,7 @@ class SampleNotificationService:
         Raises:
             MessageDeliveryException: If sending fails
         """
-        operation_start = datetime.now(UTC)
+        operation_start = time.perf_counter()
 
         try:
             self.logger.info(
@@ -70,7 +71,7 @@ class SampleNotificationService:
             }
             self._sent_messages.append(message_record)
 
-            operation_duration = (datetime.now(UTC) - operation_start).total_seconds()
+            operation_duration = time.perf_counter() - operation_start
 
             self.metrics.increment_counter("email_notifications_sent_total", {"priority": priority})
             self.metrics.record_histogram(
@@ -118,7 +119,7 @@ class SampleNotificationService:
         Returns:
             Response with message ID and status
         """
-        operation_start = datetime.now(UTC)
+        operation_start = time.perf_counter()
 
         try:
             self.logger.info(
@@ -143,7 +144,7 @@ class SampleNotificationService:
             }
             self._sent_messages.append(message_record)
 
-            operation_duration = (datetime.now(UTC) - operation_start).total_seconds()
+            operation_duration = time.perf_counter() - operation_start
 
             self.metrics.increment_counter("sms_notifications_sent_total", {"priority": priority})
             self.metrics.record_histogram(
@@ -193,7 +194,7 @@ class SampleNotificationService:
         Returns:
             Response with message ID and status
         """
-        operation_start = datetime.now(UTC)
+        operation_start = time.perf_counter()
 
         try:
             self.logger.info(
@@ -219,7 +220,7 @@ class SampleNotificationService:
             }
             self._sent_messages.append(message_record)
 
-            operation_duration = (datetime.now(UTC) - operation_start).total_seconds()
+            operation_duration = time.perf_counter() - operation_start
 
             self.metrics.increment_counter("push_notifications_sent_total", {})
             self.metrics.record_histogram(
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import time
 from datetime import UTC, datetime
-from enum import Enum
+from enum import StrEnum
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
 
-class HealthStatus(str, Enum):
+class HealthStatus(StrEnum):
     """Health status enumeration for component and system health."""
 
     HEALTHY = "healthy"
@@ -138,12 +138,12 @@ class HealthChecker:
 
         # Run all health checks
         for name, check_func in self._health_checks.items():
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 # Run check with timeout
                 result = await asyncio.wait_for(check_func(), timeout=self.timeout)
-                response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+                response_time = (time.perf_counter() - start_time) * 1000  # Convert to milliseconds
 
                 if result:
                     check_results[name] = {
@@ -169,7 +169,7 @@ class HealthChecker:
                     )
 
             except TimeoutError:
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.perf_counter() - start_time) * 1000
                 check_results[name] = {
                     "status": HealthStatus.UNHEALTHY,
                     "response_time_ms": response_time,
@@ -182,7 +182,7 @@ class HealthChecker:
                 )
 
             except Exception as e:
-                response_time = (time.time() - start_time) * 1000
+                response_time = (time.perf_counter() - start_time) * 1000
                 check_results[name] = {
                     "status": HealthStatus.UNHEALTHY,
                     "response_time_ms": response_time,
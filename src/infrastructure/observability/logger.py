@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from config.settings import get_settings
+
 if TYPE_CHECKING:
     from structlog.typing import EventDict, Processor
 else:
@@ -28,8 +30,6 @@ def add_application_context(
         Enhanced event dictionary with application context
     """
     try:
-        from config.settings import get_settings
-
         settings = get_settings()
 
         # Add application context
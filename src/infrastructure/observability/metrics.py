@@ -47,6 +47,11 @@ class MetricsCollector:
         self._counters: dict[str, Counter] = {}
         self._gauges: dict[str, Gauge] = {}
         self._histograms: dict[str, Histogram] = {}
+        self._metric_names: dict[str, str] = {}
+        self._base_labels = {
+            "service": application_name,
+            "component": "api",
+        }
 
     def _get_metric_name(self, name: str) -> str:
         """Get fully qualified metric name with application namespace.
@@ -57,9 +62,14 @@ class MetricsCollector:
         Returns:
             Namespaced metric name
         """
-        if name.startswith(f"{self.application_name}_"):
-            return name
-        return f"{self.application_name}_{name}"
+        qualified_name = self._metric_names.get(name)
+        if qualified_name is None:
+            if name.startswith(f"{self.application_name}_"):
+                qualified_name = name
+            else:
+                qualified_name = f"{self.application_name}_{name}"
+            self._metric_names[name] = qualified_name
+        return qualified_name
 
     def _get_base_labels(self, labels: dict[str, str]) -> dict[str, str]:
         """Add standard labels to all metrics.
@@ -70,12 +80,7 @@ class MetricsCollector:
         Returns:
             Labels with standard application context
         """
-        base_labels = {
-            "service": self.application_name,
-            "component": "api",
-        }
-        base_labels.update(labels)
-        return base_labels
+        return {**self._base_labels, **labels}
 
     def increment_counter(
         self,
@@ -167,11 +172,11 @@ class MetricsCollector:
             name: Histogram name for timing (will be prefixed with application namespace)
             labels: Label key-value pairs (will include standard labels)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             yield
         finally:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.record_histogram(name, duration, labels)
 
     def get_counter_value(self, name: str, labels: dict[str, str] | None = None) -> float:
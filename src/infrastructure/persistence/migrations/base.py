@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from typing import Any, Protocol
@@ -152,9 +153,9 @@ class MigrationRunner(ABC):
                 description=migration.description,
             )
 
-            start_time = datetime.now(UTC)
+            start_time = time.perf_counter()
             await migration.up(connection)
-            duration = (datetime.now(UTC) - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             await self.record_migration(migration)
 
@@ -197,9 +198,9 @@ class MigrationRunner(ABC):
                 description=migration.description,
             )
 
-            start_time = datetime.now(UTC)
+            start_time = time.perf_counter()
             await migration.down(connection)
-            duration = (datetime.now(UTC) - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             await self.remove_migration_record(migration.version)
 
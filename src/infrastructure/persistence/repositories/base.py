@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
@@ -10,7 +12,7 @@ from src.infrastructure.observability import get_logger, get_metrics_collector
 from src.shared.exceptions import ConnectionException
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Generator
+    from collections.abc import AsyncGenerator, Callable, Generator
 
 T = TypeVar("T")  # Entity type
 ID = TypeVar("ID")  # ID type - contravariance removed for simplicity
@@ -217,16 +219,33 @@ class TransactionalRepository(BaseRepository[T, ID], Repository[T, ID]):
 class CacheableRepository(BaseRepository[T, ID]):
     """Base repository with caching support."""
 
-    def __init__(self, connection_url: str, cache_ttl: int = 300) -> None:
+    def __init__(
+        self,
+        connection_url: str,
+        cache_ttl: int = 300,
+        max_cache_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize cacheable repository.
 
         Args:
             connection_url: Database connection URL
             cache_ttl: Cache time-to-live in seconds
+            max_cache_size: Maximum number of cached entities
+            clock: Monotonic clock used for cache expiry
+
+        Raises:
+            ValueError: If max_cache_size is less than 1
         """
+        if max_cache_size < 1:
+            raise ValueError("max_cache_size must be at least 1")
+
         super().__init__(connection_url)
         self.cache_ttl = cache_ttl
+        self.max_cache_size = max_cache_size
         self._cache: dict[ID, T] = {}
+        self._cache_expiry: dict[ID, float] = {}
+        self._clock = clock
 
     def _get_cache_key(self, entity_id: ID) -> str:
         """Generate cache key for entity.
@@ -249,11 +268,9 @@ class CacheableRepository(BaseRepository[T, ID]):
             Entity if found, None otherwise
         """
         # Check cache first
-        cache_key = self._get_cache_key(entity_id)
-        if entity_id in self._cache:
-            self.metrics.increment_counter("repository_cache_hits_total", {})
-            self.logger.debug("Cache hit", entity_id=entity_id, cache_key=cache_key)
-            return self._cache[entity_id]
+        entity = self._get_cached(entity_id)
+        if entity is not None:
+            return entity
 
         # Fetch from database
         self.metrics.increment_counter("repository_cache_misses_total", {})
@@ -261,11 +278,55 @@ class CacheableRepository(BaseRepository[T, ID]):
 
         # Cache the result
         if entity is not None:
-            self._cache[entity_id] = entity
-            self.logger.debug("Cached entity", entity_id=entity_id, cache_key=cache_key)
+            self._cache_entity(entity_id, entity)
 
         return entity
 
+    def _get_cached(self, entity_id: ID) -> T | None:
+        """Get entity from cache if present and not expired.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            Cached entity if fresh, None otherwise
+        """
+        if entity_id not in self._cache:
+            return None
+
+        expires_at = self._cache_expiry.get(entity_id)
+        if expires_at is not None and self._clock() >= expires_at:
+            self._invalidate_cache(entity_id)
+            return None
+
+        # Move to the end so eviction drops the least recently used entry
+        entity = self._cache.pop(entity_id)
+        self._cache[entity_id] = entity
+        self.metrics.increment_counter("repository_cache_hits_total", {})
+        self.logger.debug(
+            "Cache hit", entity_id=entity_id, cache_key=self._get_cache_key(entity_id)
+        )
+        return entity
+
+    def _cache_entity(self, entity_id: ID, entity: T) -> None:
+        """Cache entity, evicting the least recently used entries when full.
+
+        Args:
+            entity_id: Entity ID
+            entity: Entity to cache
+        """
+        self._cache.pop(entity_id, None)
+        while len(self._cache) >= self.max_cache_size:
+            oldest_id = next(iter(self._cache))
+            del self._cache[oldest_id]
+            self._cache_expiry.pop(oldest_id, None)
+
+        self._cache[entity_id] = entity
+        self._cache_expiry[entity_id] = self._clock() + self.cache_ttl
+        self.logger.debug(
+            "Cached entity", entity_id=entity_id, cache_key=self._get_cache_key(entity_id)
+        )
+
     @abstractmethod
     async def _get_by_id_from_db(self, entity_id: ID) -> T | None:
         """Get entity by ID from database (bypass cache).
@@ -283,6 +344,7 @@ class CacheableRepository(BaseRepository[T, ID]):
         Args:
             entity_id: Entity ID to invalidate
         """
+        self._cache_expiry.pop(entity_id, None)
         if entity_id in self._cache:
             del self._cache[entity_id]
             self.logger.debug("Invalidated cache", entity_id=entity_id)
@@ -354,8 +416,6 @@ class RetryMixin:
         Raises:
             Exception: If all retries fail
         """
-        import asyncio
-
         for attempt in range(self.max_retries + 1):
             try:
                 return await func(*args, **kwargs)
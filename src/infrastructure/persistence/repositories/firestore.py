@@ -15,6 +15,9 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 ID = TypeVar("ID")
 
+# Firestore rejects write batches with more than 500 operations
+_MAX_BATCH_WRITES = 500
+
 
 class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
     """Google Firestore repository implementation."""
@@ -27,6 +30,7 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
         cache_ttl: int = 300,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_cache_size: int = 1024,
     ) -> None:
         """Initialize Firestore repository.
 
@@ -37,8 +41,9 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
             cache_ttl: Cache time-to-live in seconds
             max_retries: Maximum retry attempts
             retry_delay: Retry delay in seconds
+            max_cache_size: Maximum number of cached entities
         """
-        CacheableRepository.__init__(self, connection_url, cache_ttl)
+        CacheableRepository.__init__(self, connection_url, cache_ttl, max_cache_size)
         RetryMixin.__init__(self, max_retries, retry_delay)
         self.collection_name = collection_name
         self.project_id = project_id
@@ -152,6 +157,63 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
 
             return updated_entity
 
+    async def create_many(self, entities: list[T]) -> list[T]:
+        """Create several entities in Firestore using batched writes.
+
+        Firestore limits a batch to 500 writes, so larger inputs are committed
+        as several batches and the call as a whole is not atomic. Retries reuse
+        the same document IDs, so batches that already committed are
+        overwritten via ``set()`` rather than duplicated.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            Created entities with document IDs
+
+        Raises:
+            RepositoryError: If creation fails
+        """
+        if not entities:
+            return []
+
+        # Shared across retry attempts so a retry rewrites the same documents
+        # instead of duplicating batches that already committed
+        document_ids: list[str] = []
+        return await self._with_retry("create_many", self._create_many_impl, entities, document_ids)
+
+    async def _create_many_impl(self, entities: list[T], document_ids: list[str]) -> list[T]:
+        """Internal batched create implementation."""
+        async with self._get_connection():
+            if not document_ids:
+                document_ids.extend(self._collection.document().id for _ in entities)
+
+            created_entities = []
+
+            for start in range(0, len(entities), _MAX_BATCH_WRITES):
+                batch = self._client.batch()
+                chunk = zip(
+                    entities[start : start + _MAX_BATCH_WRITES],
+                    document_ids[start : start + _MAX_BATCH_WRITES],
+                    strict=True,
+                )
+
+                for entity, document_id in chunk:
+                    entity_dict = self._entity_to_dict(entity)
+                    batch.set(self._collection.document(document_id), entity_dict)
+                    created_entities.append(
+                        self._dict_to_entity({**entity_dict, "id": document_id})
+                    )
+
+                await batch.commit()
+
+            self.logger.info("Created entities in Firestore", count=len(created_entities))
+            self.metrics.increment_counter(
+                "firestore_operations_total", {"operation": "create_many"}
+            )
+
+            return created_entities
+
     async def get_by_id(self, entity_id: ID) -> T | None:
         """Get entity by ID from Firestore with caching.
 
@@ -187,6 +249,56 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
             )
             return self._dict_to_entity(entity_dict)
 
+    async def get_many(self, entity_ids: list[ID]) -> list[T]:
+        """Get several entities by ID with caching and a single batched read.
+
+        Args:
+            entity_ids: Entity IDs to fetch
+
+        Returns:
+            Entities that exist, in the order their IDs first appear in
+            entity_ids; duplicate IDs are returned once and missing IDs are skipped
+        """
+        unique_ids = list(dict.fromkeys(entity_ids))
+        found: dict[ID, T] = {}
+        missing_ids = []
+
+        for entity_id in unique_ids:
+            cached = self._get_cached(entity_id)
+            if cached is None:
+                missing_ids.append(entity_id)
+            else:
+                found[entity_id] = cached
+
+        if missing_ids:
+            self.metrics.increment_counter(
+                "repository_cache_misses_total", {}, value=float(len(missing_ids))
+            )
+            found.update(await self._with_retry("get_many", self._get_many_impl, missing_ids))
+
+        return [found[entity_id] for entity_id in unique_ids if entity_id in found]
+
+    async def _get_many_impl(self, entity_ids: list[ID]) -> dict[ID, T]:
+        """Internal batched get implementation, keyed by requested entity ID."""
+        async with self._get_connection():
+            ids_by_document = {str(entity_id): entity_id for entity_id in entity_ids}
+            doc_refs = [self._collection.document(doc_id) for doc_id in ids_by_document]
+            entities = {}
+
+            async for doc in self._client.get_all(doc_refs):
+                if not doc.exists:
+                    continue
+                entity_dict = doc.to_dict()
+                entity_dict["id"] = doc.id
+                entity_id = ids_by_document[doc.id]
+                entity = self._dict_to_entity(entity_dict)
+                self._cache_entity(entity_id, entity)
+                entities[entity_id] = entity
+
+            self.metrics.increment_counter("firestore_operations_total", {"operation": "get_many"})
+
+            return entities
+
     async def update(self, entity: T) -> T:
         """Update entity in Firestore.
 
@@ -242,8 +354,8 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
         async with self._get_connection():
             doc_ref = self._collection.document(str(entity_id))
 
-            # Check if document exists
-            doc = await doc_ref.get()
+            # Check if document exists; an empty field mask skips the payload
+            doc = await doc_ref.get(field_paths=[])
             if not doc.exists:
                 self.metrics.increment_counter(
                     "firestore_operations_total", {"operation": "delete_not_found"}
@@ -282,10 +394,9 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
             if limit:
                 query = query.limit(limit)
 
-            docs = [doc async for doc in query.stream()]
             entities = []
 
-            for doc in docs:
+            async for doc in query.stream():
                 entity_dict = doc.to_dict()
                 entity_dict["id"] = doc.id
                 entities.append(self._dict_to_entity(entity_dict))
@@ -300,6 +411,24 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
 
             return entities
 
+    async def count(self) -> int:
+        """Count entities in Firestore using a server-side aggregation.
+
+        Returns:
+            Number of documents in the collection
+        """
+        return await self._with_retry("count", self._count_impl)
+
+    async def _count_impl(self) -> int:
+        """Internal count implementation."""
+        async with self._get_connection():
+            results = await self._collection.count().get()
+            total = int(results[0][0].value)
+
+            self.metrics.increment_counter("firestore_operations_total", {"operation": "count"})
+
+            return total
+
     def _entity_to_dict(self, entity: T) -> dict[str, Any]:
         """Convert entity to dictionary for Firestore storage.
 
@@ -372,10 +501,9 @@ class FirestoreRepository(CacheableRepository[T, ID], RetryMixin):
             if limit:
                 query = query.limit(limit)
 
-            docs = [doc async for doc in query.stream()]
             entities = []
 
-            for doc in docs:
+            async for doc in query.stream():
                 entity_dict = doc.to_dict()
                 entity_dict["id"] = doc.id
                 entities.append(self._dict_to_entity(entity_dict))
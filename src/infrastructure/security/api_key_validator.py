@@ -7,6 +7,9 @@ from fastapi import Header, HTTPException
 from src.infrastructure.observability import get_logger, get_metrics_collector
 from src.shared.exceptions import ApplicationError
 
+_SUCCESS_LABELS = {"status": "success"}
+_FAILURE_LABELS = {"status": "failure"}
+
 
 class APIKeyValidationError(ApplicationError):
     """Exception raised when API key validation fails."""
@@ -150,15 +153,14 @@ def verify_api_key(
     # Validate API key
     if validator.validate(api_key):
         # Log successful authentication (with prefix for security)
-        api_key_prefix = api_key[:8] + "..." if api_key else "None"
-        logger.info(
+        logger.debug(
             "API key validation successful",
-            api_key_prefix=api_key_prefix,
+            api_key_prefix=api_key[:8] + "..." if api_key else "None",
             auth_method=auth_method,
         )
 
         # Record success metrics
-        metrics.increment_counter("api_key_validations_total", {"status": "success"})
+        metrics.increment_counter("api_key_validations_total", _SUCCESS_LABELS)
 
         return api_key  # type: ignore[return-value]
 
@@ -171,7 +173,7 @@ def verify_api_key(
     )
 
     # Record failure metrics
-    metrics.increment_counter("api_key_validations_total", {"status": "failure"})
+    metrics.increment_counter("api_key_validations_total", _FAILURE_LABELS)
 
     # Raise HTTP exception for failed validation
     raise HTTPException(
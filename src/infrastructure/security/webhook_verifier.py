@@ -165,7 +165,7 @@ async def verify_webhook_signature(request: Request) -> bytes:
         )
 
     # Log successful verification
-    logger.info("Webhook signature verified successfully", client_ip=client_ip)
+    logger.debug("Webhook signature verified successfully", client_ip=client_ip)
     metrics_collector.increment_counter(
         "webhook_verification_successes_total",
         {"client_ip": client_ip},
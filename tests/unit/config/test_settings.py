@@ -100,6 +100,12 @@ class TestAPISettings:
             APISettings(port=70000)
         assert "less than or equal to 65535" in str(exc_info.value)
 
+    def test_is_immutable(self) -> None:
+        """Rejects attribute assignment after construction."""
+        settings = APISettings()
+        with pytest.raises(ValidationError):
+            settings.port = 9000  # type: ignore[misc]
+
 
 class TestDatabaseType:
     """Tests for DatabaseType enum."""
@@ -174,6 +180,13 @@ class TestDatabaseSettings:
         settings = DatabaseSettings(primary_db=DatabaseType.REDIS)
         assert settings.supports_acid() is False
 
+    def test_capabilities_accept_string_valued_copy(self) -> None:
+        """Reports PostgreSQL capabilities when model_copy stores a raw string."""
+        settings = DatabaseSettings().model_copy(update={"primary_db": "postgresql"})
+
+        assert settings.supports_acid() is True
+        assert settings.requires_schema_migrations() is True
+
     def test_requires_schema_migrations(self) -> None:
         """Tests requires_schema_migrations method."""
         settings = DatabaseSettings(primary_db=DatabaseType.POSTGRESQL)
@@ -403,6 +416,28 @@ class TestApplicationSettings:
         with pytest.raises(ConfigurationException, match="Debug mode cannot be enabled"):
             settings.validate_configuration()
 
+    def test_validate_production_settings_raises_for_string_valued_copy(self) -> None:
+        """Applies production checks when model_copy stores raw string values."""
+        settings = ApplicationSettings().model_copy(
+            update={"environment": "production", "debug": True}
+        )
+
+        assert settings.is_production() is True
+        with pytest.raises(ConfigurationException, match="Debug mode cannot be enabled"):
+            settings.validate_configuration()
+
+    def test_validate_production_settings_raises_for_string_valued_in_memory_db(self) -> None:
+        """Rejects an in-memory database stored as a raw string in production."""
+        settings = ApplicationSettings(
+            environment=Environment.PRODUCTION,
+            security=SecuritySettings(api_keys=["real-key"]),
+        ).model_copy(
+            update={"database": DatabaseSettings().model_copy(update={"primary_db": "in_memory"})}
+        )
+
+        with pytest.raises(ConfigurationException, match="In-memory database cannot be used"):
+            settings.validate_configuration()
+
     def test_validate_production_settings_raises_for_sample_api_keys(self) -> None:
         """Raises error when sample API keys are used in production."""
         settings = ApplicationSettings(
@@ -435,6 +470,16 @@ class TestApplicationSettings:
         with pytest.raises(ConfigurationException, match="PostgreSQL enabled but database URL"):
             settings.validate_configuration()
 
+    def test_validate_database_configuration_accepts_postgresql_driver_url(self) -> None:
+        """Accepts PostgreSQL URLs that name an async driver."""
+        settings = ApplicationSettings(
+            database=DatabaseSettings(
+                enable_postgresql=True,
+                database_url="postgresql+asyncpg://localhost/db",
+            ),
+        )
+        settings.validate_configuration()  # Should not raise
+
     def test_validate_database_configuration_redis_no_url(self) -> None:
         """Raises error when Redis cache is enabled but no URL provided."""
         settings = ApplicationSettings(
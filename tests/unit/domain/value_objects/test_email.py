@@ -175,6 +175,17 @@ class TestEmailProperties:
         assert email.local_part == "test.user+tag"
         assert email.domain == "sub.domain.co.uk"
 
+    def test_derived_parts_follow_model_copy_updates(self) -> None:
+        """Derives domain and local part from the copied value, not a stale read."""
+        email = Email(value="a@gmail.com")
+        assert email.domain == "gmail.com"
+
+        copied = email.model_copy(update={"value": "b@corp.com"})
+
+        assert copied.domain == "corp.com"
+        assert copied.local_part == "b"
+        assert copied.is_business_email() is True
+
 
 class TestEmailBusinessLogic:
     """Test business logic methods."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.domain.value_objects.phone_number import PhoneNumber
+from src.domain.value_objects.phone_number import PhoneNumber, _normalize_phone_number
 from src.shared.exceptions import ValidationException
 
 
@@ -34,6 +34,16 @@ class TestPhoneNumberValidation:
         phone = PhoneNumber(value="+1 (555) 123-4567")
         assert phone.value == "+15551234567"
 
+    def test_repeated_numbers_reuse_cached_normalization(self) -> None:
+        """Skips revalidation when the same raw number is seen again."""
+        _normalize_phone_number.cache_clear()
+
+        first = PhoneNumber(value="+1 (555) 123-4567")
+        second = PhoneNumber(value="+1 (555) 123-4567")
+
+        assert first == second
+        assert _normalize_phone_number.cache_info().hits == 1
+
     def test_empty_phone_number_raises_validation_error(self) -> None:
         """Raises ValidationException for empty phone number."""
         with pytest.raises(ValidationException) as exc_info:
@@ -199,6 +209,16 @@ class TestPhoneNumberProperties:
         assert len(national) > 0
         assert not national.startswith("+")
 
+    def test_derived_parts_follow_model_copy_updates(self) -> None:
+        """Derives country code and national number from the copied value."""
+        phone = PhoneNumber(value="+15551234567")
+        assert phone.country_code == "1"
+
+        copied = phone.model_copy(update={"value": "+4479111234"})
+
+        assert copied.country_code == "44"
+        assert copied.national_number == "79111234"
+
 
 class TestPhoneNumberFormatting:
     """Test phone number formatting methods."""
@@ -212,10 +212,10 @@ class TestValidationExceptionHandler:
     @patch("src.infrastructure.api.exception_handlers.get_logger")
     @patch("src.infrastructure.api.exception_handlers.get_metrics_collector")
     @pytest.mark.asyncio
-    async def test_simulates_async_work(
+    async def test_responds_without_artificial_delay(
         self, mock_get_metrics: MagicMock, mock_get_logger: MagicMock, mock_request: Request
     ) -> None:
-        """Handler simulates async work with sleep."""
+        """Handler builds the response without yielding to the event loop."""
         mock_logger = MagicMock()
         mock_metrics = MagicMock()
         mock_get_logger.return_value = mock_logger
@@ -223,9 +223,11 @@ class TestValidationExceptionHandler:
 
         exc = ValidationException("Test error")
 
-        # Handler should complete successfully (sleep is brief)
-        response = await validation_exception_handler(mock_request, exc)
+        with patch("asyncio.sleep") as mock_sleep:
+            response = await validation_exception_handler(mock_request, exc)
+
         assert response.status_code == 422
+        mock_sleep.assert_not_called()
 
 
 class TestNotFoundExceptionHandler:
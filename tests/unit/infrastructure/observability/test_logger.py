@@ -325,7 +325,9 @@ class TestAddApplicationContext:
         method_name = "info"
         event_dict = {"message": "test log message"}
 
-        with patch("config.settings.get_settings", return_value=mock_settings):
+        with patch(
+            "src.infrastructure.observability.logger.get_settings", return_value=mock_settings
+        ):
             result = add_application_context(mock_logger, method_name, event_dict)
 
         # Should add application context from settings
@@ -350,7 +352,9 @@ class TestAddApplicationContext:
             "custom_field": "custom_value",  # Should be preserved
         }
 
-        with patch("config.settings.get_settings", return_value=mock_settings):
+        with patch(
+            "src.infrastructure.observability.logger.get_settings", return_value=mock_settings
+        ):
             result = add_application_context(mock_logger, method_name, event_dict)
 
         # Should preserve existing values using setdefault
@@ -368,7 +372,7 @@ class TestAddApplicationContext:
 
         # Mock get_settings to raise an exception
         with patch(
-            "config.settings.get_settings",
+            "src.infrastructure.observability.logger.get_settings",
             side_effect=ImportError("Settings not available"),
         ):
             result = add_application_context(mock_logger, method_name, event_dict)
@@ -387,7 +391,7 @@ class TestAddApplicationContext:
 
         # Mock get_settings to raise a different exception
         with patch(
-            "config.settings.get_settings",
+            "src.infrastructure.observability.logger.get_settings",
             side_effect=RuntimeError("Configuration error"),
         ):
             result = add_application_context(mock_logger, method_name, event_dict)
@@ -409,7 +413,7 @@ class TestAddApplicationContext:
         }
 
         with patch(
-            "config.settings.get_settings",
+            "src.infrastructure.observability.logger.get_settings",
             side_effect=Exception("Any error"),
         ):
             result = add_application_context(mock_logger, method_name, event_dict)
@@ -430,7 +434,9 @@ class TestAddApplicationContext:
         method_name = "info"
         event_dict: dict[str, str] = {}  # Empty dict
 
-        with patch("config.settings.get_settings", return_value=mock_settings):
+        with patch(
+            "src.infrastructure.observability.logger.get_settings", return_value=mock_settings
+        ):
             result = add_application_context(mock_logger, method_name, event_dict)
 
         # Should add all context fields to empty dict
@@ -449,7 +455,9 @@ class TestAddApplicationContext:
         method_name = "info"
         original_event_dict = {"original": "data"}
 
-        with patch("config.settings.get_settings", return_value=mock_settings):
+        with patch(
+            "src.infrastructure.observability.logger.get_settings", return_value=mock_settings
+        ):
             result = add_application_context(mock_logger, method_name, original_event_dict)
 
         # Should return the same dict object, modified
@@ -153,6 +153,16 @@ class TestMetricsCollector:
 
         assert first_counter is second_counter
 
+    def test_caches_qualified_metric_names(self) -> None:
+        """Reuses the cached qualified name and never double-prefixes."""
+        collector = MetricsCollector(application_name="test_app")
+
+        first_name = collector._get_metric_name("cached_counter")
+
+        assert first_name == "test_app_cached_counter"
+        assert collector._get_metric_name("cached_counter") is first_name
+        assert collector._get_metric_name("test_app_already") == "test_app_already"
+
     def test_reuses_existing_gauge(self) -> None:
         """Reuses existing gauge for same name."""
         collector = MetricsCollector(application_name="test_app")
@@ -258,6 +258,40 @@ class TestCacheableRepositoryBehaviour:
         assert result is None
         assert "nonexistent" not in repo._cache
 
+    async def test_expired_cache_entry_is_refetched(self) -> None:
+        """Should refetch entity from database once its cache entry expires."""
+        clock = MagicMock(return_value=1000.0)
+        repo = MockCacheableRepository("test://connection", cache_ttl=60, clock=clock)
+
+        first = await repo.get_by_id("existing")
+        clock.return_value = 1061.0
+        second = await repo.get_by_id("existing")
+
+        assert first is not None
+        assert second is not None
+        assert second is not first
+        assert repo._cache["existing"] is second
+
+    def test_rejects_non_positive_max_cache_size(self) -> None:
+        """Should reject a cache size that cannot hold any entity."""
+        with pytest.raises(ValueError, match="max_cache_size"):
+            MockCacheableRepository("test://connection", max_cache_size=0)
+
+    async def test_evicts_least_recently_used_entry_when_full(self) -> None:
+        """Should evict the least recently used entity once the cache is full."""
+        repo = MockCacheableRepository("test://connection", max_cache_size=2)
+        repo._get_by_id_from_db = AsyncMock(  # type: ignore[method-assign]
+            side_effect=lambda entity_id: TestEntity(entity_id, "test")
+        )
+
+        await repo.get_by_id("first")
+        await repo.get_by_id("second")
+        await repo.get_by_id("first")
+        await repo.get_by_id("third")
+
+        assert list(repo._cache) == ["first", "third"]
+        assert "second" not in repo._cache_expiry
+
     def test_cache_invalidation_removes_entity_from_cache(self) -> None:
         """Should remove entity from cache when invalidated."""
         repo = MockCacheableRepository("test://connection")
@@ -63,12 +63,14 @@ class TestFirestoreRepositoryInitialisation:
             cache_ttl=600,
             max_retries=5,
             retry_delay=2.0,
+            max_cache_size=50,
         )
 
         assert repo.connection_url == "firestore://project"
         assert repo.collection_name == "test_entities"
         assert repo.project_id == "test-project"
         assert repo.cache_ttl == 600
+        assert repo.max_cache_size == 50
         assert repo.max_retries == 5
         assert repo.retry_delay == 2.0
         assert repo._client is None
@@ -269,6 +271,122 @@ class TestFirestoreCrudOperations:
                 assert result.name == "test_entity"
                 mock_retry.assert_called_once_with("create", repo._create_impl, entity)
 
+    async def test_creates_many_entities_with_retry(self) -> None:
+        """Should delegate batched creation to the retry wrapper."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+        entities = [TestEntity(None, "first"), TestEntity(None, "second")]
+
+        with patch.object(repo, "_with_retry", new_callable=AsyncMock) as mock_retry:
+            mock_retry.return_value = [TestEntity("1", "first"), TestEntity("2", "second")]
+
+            result = await repo.create_many(entities)
+
+            assert [entity.id for entity in result] == ["1", "2"]
+            mock_retry.assert_called_once_with("create_many", repo._create_many_impl, entities, [])
+
+    async def test_create_many_with_no_entities_skips_firestore(self) -> None:
+        """Should return an empty list without touching Firestore."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+
+        with patch.object(repo, "_with_retry", new_callable=AsyncMock) as mock_retry:
+            result = await repo.create_many([])
+
+            assert result == []
+            mock_retry.assert_not_called()
+
+    async def test_creates_many_entities_in_chunked_batches(self) -> None:
+        """Should write entities with one batch commit per 500 documents."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+        entities = [TestEntity(None, f"entity_{i}") for i in range(501)]
+        doc_ids = iter(range(len(entities)))
+        batches = []
+
+        def new_batch() -> Mock:
+            batch = Mock()
+            batch.commit = AsyncMock()
+            batches.append(batch)
+            return batch
+
+        mock_client = Mock()
+        mock_client.batch = Mock(side_effect=new_batch)
+        mock_collection = Mock()
+        mock_collection.document = Mock(
+            side_effect=lambda doc_id=None: Mock(id=doc_id or str(next(doc_ids)))
+        )
+
+        with patch.object(repo, "_get_connection") as mock_get_conn:
+            mock_context = AsyncMock()
+            mock_context.__aenter__ = AsyncMock(return_value=None)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            mock_get_conn.return_value = mock_context
+            repo._client = mock_client
+            repo._collection = mock_collection
+
+            result = await repo._create_many_impl(entities, [])
+
+            assert len(result) == 501
+            assert result[0].id == "0"
+            assert result[-1].name == "entity_500"
+            assert len(batches) == 2
+            assert batches[0].set.call_count == 500
+            assert batches[1].set.call_count == 1
+            for batch in batches:
+                batch.commit.assert_awaited_once()
+
+    async def test_retried_create_many_rewrites_same_documents(self) -> None:
+        """Should reuse document IDs when a later batch fails and the call is retried."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project",
+            collection_name="test_entities",
+            retry_delay=0,
+        )
+        entities = [TestEntity(None, f"entity_{i}") for i in range(501)]
+        doc_ids = iter(range(10_000))
+        stored: dict[str, Any] = {}
+        commit_calls = 0
+
+        def new_batch() -> Mock:
+            pending: dict[str, Any] = {}
+
+            async def commit() -> None:
+                nonlocal commit_calls
+                commit_calls += 1
+                if commit_calls == 2:
+                    raise RuntimeError("Commit failed")
+                stored.update(pending)
+
+            batch = Mock()
+            batch.set = Mock(side_effect=lambda ref, data: pending.__setitem__(ref.id, data))
+            batch.commit = commit
+            return batch
+
+        mock_client = Mock()
+        mock_client.batch = Mock(side_effect=new_batch)
+        mock_collection = Mock()
+        mock_collection.document = Mock(
+            side_effect=lambda doc_id=None: Mock(id=doc_id or str(next(doc_ids)))
+        )
+
+        with patch.object(repo, "_get_connection") as mock_get_conn:
+            mock_context = AsyncMock()
+            mock_context.__aenter__ = AsyncMock(return_value=None)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            mock_get_conn.return_value = mock_context
+            repo._client = mock_client
+            repo._collection = mock_collection
+
+            result = await repo.create_many(entities)
+
+        assert len(result) == 501
+        assert len(stored) == 501
+        assert {entity.id for entity in result} == set(stored)
+
     async def test_retrieves_entity_by_id_using_cache(self) -> None:
         """Should retrieve entity by ID using cache-first approach."""
         repo = MockFirestoreRepository(
@@ -434,6 +552,137 @@ class TestFirestoreQueryOperations:
 
             mock_query.limit.assert_called_once_with(3)
 
+    async def test_gets_many_entities_with_retry(self) -> None:
+        """Should delegate batched reads to the retry wrapper."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+        first, second = TestEntity("1", "first"), TestEntity("2", "second")
+
+        with patch.object(repo, "_with_retry", new_callable=AsyncMock) as mock_retry:
+            mock_retry.return_value = {"2": second, "1": first}
+
+            result = await repo.get_many(["1", "2"])
+
+            assert result == [first, second]
+            mock_retry.assert_called_once_with("get_many", repo._get_many_impl, ["1", "2"])
+
+    async def test_get_many_with_no_ids_skips_read(self) -> None:
+        """Should return an empty list without a Firestore round-trip."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+
+        with patch.object(repo, "_with_retry", new_callable=AsyncMock) as mock_retry:
+            result = await repo.get_many([])
+
+            assert result == []
+            mock_retry.assert_not_called()
+
+    async def test_get_many_serves_cache_hits_and_fetches_only_misses(self) -> None:
+        """Should read only uncached IDs, cache them, and keep the caller's order."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+        cached_entity = TestEntity("1", "cached")
+        repo._cache_entity("1", cached_entity)
+        fetched_doc = Mock(exists=True, id="2")
+        fetched_doc.to_dict = Mock(return_value={"name": "fetched"})
+
+        async def get_all(_refs: list[Any]) -> Any:
+            yield fetched_doc
+
+        mock_client = Mock()
+        mock_client.get_all = Mock(side_effect=get_all)
+        mock_collection = Mock()
+        mock_collection.document = Mock(side_effect=lambda doc_id: f"ref-{doc_id}")
+
+        with patch.object(repo, "_get_connection") as mock_get_conn:
+            mock_context = AsyncMock()
+            mock_context.__aenter__ = AsyncMock(return_value=None)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            mock_get_conn.return_value = mock_context
+            repo._client = mock_client
+            repo._collection = mock_collection
+
+            result = await repo.get_many(["2", "1", "2", "3"])
+
+            assert len(result) == 2
+            assert result[0].name == "fetched"
+            assert result[1] is cached_entity
+            mock_client.get_all.assert_called_once_with(["ref-2", "ref-3"])
+            assert await repo.get_by_id("2") is result[0]
+
+    async def test_gets_many_entities_in_single_batched_read(self) -> None:
+        """Should fetch all documents with one get_all call and skip missing ones."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+        found_doc = Mock(exists=True, id="1")
+        found_doc.to_dict = Mock(return_value={"name": "first"})
+        missing_doc = Mock(exists=False, id="2")
+
+        async def get_all(_refs: list[Any]) -> Any:
+            for doc in (found_doc, missing_doc):
+                yield doc
+
+        mock_client = Mock()
+        mock_client.get_all = Mock(side_effect=get_all)
+        mock_collection = Mock()
+        mock_collection.document = Mock(side_effect=lambda doc_id: f"ref-{doc_id}")
+
+        with patch.object(repo, "_get_connection") as mock_get_conn:
+            mock_context = AsyncMock()
+            mock_context.__aenter__ = AsyncMock(return_value=None)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            mock_get_conn.return_value = mock_context
+            repo._client = mock_client
+            repo._collection = mock_collection
+
+            result = await repo._get_many_impl(["1", "2"])
+
+            assert list(result) == ["1"]
+            assert result["1"].id == "1"
+            assert result["1"].name == "first"
+            mock_client.get_all.assert_called_once_with(["ref-1", "ref-2"])
+
+    async def test_counts_entities_with_retry(self) -> None:
+        """Should delegate counting to the retry wrapper."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+
+        with patch.object(repo, "_with_retry", new_callable=AsyncMock) as mock_retry:
+            mock_retry.return_value = 42
+
+            result = await repo.count()
+
+            assert result == 42
+            mock_retry.assert_called_once_with("count", repo._count_impl)
+
+    async def test_counts_entities_with_server_side_aggregation(self) -> None:
+        """Should count documents with an aggregation query instead of streaming them."""
+        repo = MockFirestoreRepository(
+            connection_url="firestore://project", collection_name="test_entities"
+        )
+        mock_collection = Mock()
+        mock_aggregation = Mock()
+        mock_aggregation.get = AsyncMock(return_value=[[Mock(value=7)]])
+        mock_collection.count = Mock(return_value=mock_aggregation)
+
+        with patch.object(repo, "_get_connection") as mock_get_conn:
+            mock_context = AsyncMock()
+            mock_context.__aenter__ = AsyncMock(return_value=None)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            mock_get_conn.return_value = mock_context
+            repo._collection = mock_collection
+
+            result = await repo._count_impl()
+
+            assert result == 7
+            mock_collection.count.assert_called_once_with()
+            mock_collection.stream.assert_not_called()
+
 
 @pytest.mark.unit
 @pytest.mark.behaviour
@@ -770,8 +1019,10 @@ class TestFirestoreImplementationBehaviour:
 
         # Mock existing document
         mock_doc.exists = True
+        requested_field_paths = []
 
-        async def mock_get():
+        async def mock_get(field_paths=None):
+            requested_field_paths.append(field_paths)
             return mock_doc
 
         mock_doc_ref.get = mock_get
@@ -797,6 +1048,7 @@ class TestFirestoreImplementationBehaviour:
             assert result is True
             mock_collection.document.assert_called_once_with("test_id")
             mock_doc_ref.delete.assert_called_once()
+            assert requested_field_paths == [[]]
 
     @patch("google.cloud.firestore.AsyncClient")
     async def test_delete_not_found_covers_missing_lines(
@@ -811,7 +1063,7 @@ class TestFirestoreImplementationBehaviour:
         # Mock non-existing document
         mock_doc.exists = False
 
-        async def mock_get():
+        async def mock_get(field_paths=None):
             return mock_doc
 
         mock_doc_ref.get = mock_get
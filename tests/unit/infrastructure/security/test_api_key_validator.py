@@ -264,6 +264,21 @@ class TestVerifyAPIKeyBasics:
             "api_key_validations_total", {"status": "success"}
         )
 
+    @patch("src.infrastructure.security.api_key_validator.get_logger")
+    @patch("src.infrastructure.security.api_key_validator.get_metrics_collector")
+    def test_logs_success_at_debug_level(
+        self, mock_metrics: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        """Logs successful validation at debug level to keep the request path quiet."""
+        mock_logger_instance = MagicMock()
+        mock_logger.return_value = mock_logger_instance
+        mock_metrics.return_value = MagicMock()
+
+        verify_api_key(x_api_key="valid_key_123", authorization=None)
+
+        mock_logger_instance.debug.assert_called_once()
+        mock_logger_instance.info.assert_not_called()
+
     @patch("src.infrastructure.security.api_key_validator.get_logger")
     @patch("src.infrastructure.security.api_key_validator.get_metrics_collector")
     def test_records_failure_metrics(self, mock_metrics: MagicMock, mock_logger: MagicMock) -> None:
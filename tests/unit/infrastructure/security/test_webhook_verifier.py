@@ -360,6 +360,32 @@ class TestVerifyWebhookSignature:
             "webhook_verification_successes_total", {"client_ip": "192.168.1.100"}
         )
 
+    @pytest.mark.asyncio
+    @patch("src.infrastructure.security.webhook_verifier.get_logger")
+    @patch("src.infrastructure.security.webhook_verifier.get_metrics_collector")
+    async def test_logs_success_at_debug_level(
+        self, mock_metrics: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        """Logs successful verification at debug rather than info level."""
+        mock_logger_instance = MagicMock()
+        mock_logger.return_value = mock_logger_instance
+        mock_metrics.return_value = MagicMock()
+
+        payload = b"debug log payload"
+        signature = hmac.new(b"webhook_test_secret", payload, hashlib.sha256).hexdigest()
+
+        mock_request = AsyncMock(spec=Request)
+        mock_request.headers = {"X-Webhook-Signature": signature}
+        mock_request.body.return_value = payload
+        mock_request.client.host = "192.168.1.100"
+
+        await verify_webhook_signature(mock_request)
+
+        mock_logger_instance.debug.assert_called_once_with(
+            "Webhook signature verified successfully", client_ip="192.168.1.100"
+        )
+        mock_logger_instance.info.assert_not_called()
+
     @pytest.mark.asyncio
     @patch("src.infrastructure.security.webhook_verifier.get_logger")
     @patch("src.infrastructure.security.webhook_verifier.get_metrics_collector")